@@ -2,7 +2,7 @@ import logging
 
 from discord.ext.commands import AutoShardedBot
 
-from capy_discord.utils import EXTENSIONS
+from capy_discord.utils import get_extensions
 
 
 class Bot(AutoShardedBot):
@@ -15,7 +15,7 @@ class Bot(AutoShardedBot):
 
     async def load_extensions(self) -> None:
         """Load all enabled extensions."""
-        for extension in EXTENSIONS:
+        for extension in get_extensions():
             try:
                 await self.load_extension(extension)
                 self.log.info("Loaded extension: %s", extension)
@@ -1,5 +1,7 @@
 import logging
 from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import discord
@@ -12,6 +14,11 @@ from capy_discord.ui.views import BaseView
 
 from ._schemas import UserProfileSchema
 
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+UTC = ZoneInfo("UTC")
+
 
 class ConfirmDeleteView(BaseView):
     """View to confirm profile deletion."""
@@ -47,6 +54,14 @@ class Profile(commands.Cog):
         self.log = logging.getLogger(__name__)
         # In-memory storage for demonstration.
         self.profiles: dict[int, UserProfileSchema] = {}
+        # Map each action choice to its handler once instead of branching per call.
+        self._actions: dict[str, Callable[[discord.Interaction], Awaitable[None]]] = {
+            "create": partial(self.handle_edit_action, action="create"),
+            "update": partial(self.handle_edit_action, action="update"),
+            "show": self.handle_show_action,
+            "delete": self.handle_delete_action,
+            "test": self.handle_test_action,
+        }
 
     @app_commands.command(name="profile", description="Manage your profile")
     @app_commands.describe(action="The action to perform with your profile")
@@ -61,14 +76,9 @@ class Profile(commands.Cog):
     )
     async def profile(self, interaction: discord.Interaction, action: str) -> None:
         """Handle profile actions based on the selected choice."""
-        if action in ["create", "update"]:
-            await self.handle_edit_action(interaction, action)
-        elif action == "show":
-            await self.handle_show_action(interaction)
-        elif action == "delete":
-            await self.handle_delete_action(interaction)
-        elif action == "test":
-            await interaction.response.send_message("Profile Cog: **Test Version 2.0**", ephemeral=True)
+        handler = self._actions.get(action)
+        if handler:
+            await handler(interaction)
 
     async def handle_edit_action(self, interaction: discord.Interaction, action: str) -> None:
         """Logic for creating or updating a profile."""
@@ -101,21 +111,27 @@ class Profile(commands.Cog):
         )
         await interaction.response.send_modal(modal)
 
+    async def handle_test_action(self, interaction: discord.Interaction) -> None:
+        """Logic for the 'test' choice."""
+        await interaction.response.send_message("Profile Cog: **Test Version 2.0**", ephemeral=True)
+
     async def handle_show_action(self, interaction: discord.Interaction) -> None:
         """Logic for the 'show' choice."""
-        profile = self.profiles.get(interaction.user.id)
+        user = interaction.user
+        profile = self.profiles.get(user.id)
 
         if not profile:
             embed = error_embed("No Profile", "You haven't set up a profile yet! Use `/profile action:create`.")
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        embed = self._create_profile_embed(interaction.user, profile)
+        embed = self._create_profile_embed(user, profile)
         await interaction.response.send_message(embed=embed)
 
     async def handle_delete_action(self, interaction: discord.Interaction) -> None:
         """Logic for the 'delete' choice."""
-        profile = self.profiles.get(interaction.user.id)
+        user_id = interaction.user.id
+        profile = self.profiles.get(user_id)
 
         if not profile:
             embed = error_embed("No Profile", "You don't have a profile to delete.")
@@ -133,7 +149,7 @@ class Profile(commands.Cog):
 
         if view.value is True:
             # [DB CALL]: Delete profile
-            del self.profiles[interaction.user.id]
+            self.profiles.pop(user_id, None)
             self.log.info("Deleted profile for user %s", interaction.user)
             embed = success_embed("Profile Deleted", "Your profile has been deleted.")
             await interaction.followup.send(embed=embed, ephemeral=True)
@@ -163,7 +179,7 @@ class Profile(commands.Cog):
         embed.add_field(name="Email", value=profile.school_email, inline=True)
 
         # Only show last 4 of ID for privacy in the embed
-        now = datetime.now(ZoneInfo("UTC")).strftime("%Y-%m-%d %H:%M")
+        now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M")
         embed.set_footer(text=f"Student ID: *****{profile.student_id[-4:]} • Last updated: {now}")
         return embed
 
@@ -1,25 +1,62 @@
+import heapq
+import importlib
 import logging
+from collections.abc import Set
 from typing import Literal
 
 import discord
 from discord import app_commands, ui
 from discord.ext import commands
-from discord.ext.commands import AutoShardedBot, Bot
 
 from capy_discord.config import settings
 from capy_discord.ui.embeds import error_embed, success_embed
 from capy_discord.ui.views import BaseView
-from capy_discord.utils.extensions import walk_extensions
+from capy_discord.utils.extensions import get_extensions
 
 log = logging.getLogger(__name__)
 
+HOTSWAP_EXTENSION = "capy_discord.exts.tools.hotswap"
+MAX_SELECT_OPTIONS = 25
+
+
+async def _apply_action(bot: commands.Bot, interaction: discord.Interaction, action: str, extension: str) -> None:
+    """Perform the hotswap action on an extension and report the result."""
+    # Importing an extension can be slow, so acknowledge the interaction before doing any work
+    await interaction.response.defer(ephemeral=True, thinking=True)
+
+    try:
+        if action == "reload":
+            await bot.reload_extension(extension)
+        elif action == "load":
+            await bot.load_extension(extension)
+        elif action == "unload":
+            await bot.unload_extension(extension)
+
+        await interaction.followup.send(
+            embed=success_embed(
+                f"Extension {action.capitalize()}ed",
+                f"Successfully {action}ed `{extension}`.",
+            ),
+            ephemeral=True,
+        )
+    except Exception as e:
+        log.exception("Failed to %s extension %s", action, extension)
+        await interaction.followup.send(
+            embed=error_embed(
+                f"Failed to {action.capitalize()} Extension",
+                f"An error occurred while {action}ing `{extension}`: `{e}`",
+            ),
+            ephemeral=True,
+        )
+
 
 class HotswapSelect(ui.Select):
     """Dropdown for selecting extensions to hotswap."""
 
-    def __init__(self, extensions: list[str], action: str) -> None:
+    def __init__(self, extensions: list[str], action: str, bot: commands.Bot) -> None:
         """Initialize the HotswapSelect dropdown."""
         self.action = action
+        self.bot = bot
         options = [discord.SelectOption(label=ext, value=ext) for ext in extensions]
         super().__init__(
             placeholder=f"Select an extension to {action}...",
@@ -30,46 +67,16 @@ class HotswapSelect(ui.Select):
 
     async def callback(self, interaction: discord.Interaction) -> None:
         """Handle the selection and perform the requested action."""
-        cog_name = self.values[0]
-        bot = interaction.client
-
-        if not isinstance(bot, (Bot, AutoShardedBot)):
-            log.error("Interaction client is not a Bot or AutoShardedBot instance.")
-            return
-
-        try:
-            if self.action == "reload":
-                await bot.reload_extension(cog_name)
-            elif self.action == "load":
-                await bot.load_extension(cog_name)
-            elif self.action == "unload":
-                await bot.unload_extension(cog_name)
-
-            await interaction.response.send_message(
-                embed=success_embed(
-                    f"Extension {self.action.capitalize()}ed",
-                    f"Successfully {self.action}ed `{cog_name}`.",
-                ),
-                ephemeral=True,
-            )
-        except Exception as e:
-            log.exception("Failed to %s extension %s", self.action, cog_name)
-            await interaction.response.send_message(
-                embed=error_embed(
-                    f"Failed to {self.action.capitalize()} Extension",
-                    f"An error occurred while {self.action}ing `{cog_name}`: `{e}`",
-                ),
-                ephemeral=True,
-            )
+        await _apply_action(self.bot, interaction, self.action, self.values[0])
 
 
 class HotswapView(BaseView):
     """View for hotswapping extensions."""
 
-    def __init__(self, extensions: list[str], action: str, *, timeout: float | None = 180) -> None:
+    def __init__(self, extensions: list[str], action: str, bot: commands.Bot, *, timeout: float | None = 180) -> None:
         """Initialize the HotswapView."""
         super().__init__(timeout=timeout)
-        self.add_item(HotswapSelect(extensions, action))
+        self.add_item(HotswapSelect(extensions, action, bot))
 
 
 class HotswapCog(commands.Cog):
@@ -79,44 +86,104 @@ class HotswapCog(commands.Cog):
         """Initialize the HotswapCog."""
         self.bot = bot
 
-    def get_unloaded_cogs(self) -> list[str]:
-        """Get a list of cogs that are currently not loaded."""
-        all_extensions = set(walk_extensions())
-        loaded_extensions = set(self.bot.extensions.keys())
-        return sorted(all_extensions - loaded_extensions)
-
-    @app_commands.command(name="hotswap", description="Reload, load, or unload bot extensions.")
-    @app_commands.describe(action="The action to perform")
+    def get_unloaded_cogs(self) -> frozenset[str]:
+        """Get the cogs that are currently not loaded."""
+        return get_extensions().difference(self.bot.extensions)
+
+    def _targets(self, action: str | None) -> Set[str]:
+        """Get every extension the action can be applied to.
+
+        Actions that don't take an extension, or no action at all, have no targets.
+        """
+        if action == "load":
+            return self.get_unloaded_cogs()
+        if action in ("reload", "unload"):
+            # Prevent self-reload/unload to avoid potentially breaking the hotswap command during use
+            return self.bot.extensions.keys() - {HOTSWAP_EXTENSION}
+        return frozenset()
+
+    def _candidates(self, action: str | None, query: str = "") -> list[str]:
+        """Get the first extensions (alphabetically) matching the query that the action can be applied to.
+
+        Discord select menus and autocomplete results are limited to 25 options, so only
+        that many are kept instead of sorting every candidate.
+        """
+        query = query.lower()
+        return heapq.nsmallest(MAX_SELECT_OPTIONS, (ext for ext in self._targets(action) if query in ext.lower()))
+
+    @app_commands.command(name="hotswap", description="Reload, load, or unload bot extensions, or rescan for new ones.")
+    @app_commands.describe(
+        action="The action to perform",
+        extension="The extension to act on (leave empty to pick from a menu)",
+    )
     @app_commands.checks.has_permissions(administrator=True)
     async def hotswap(
         self,
         interaction: discord.Interaction,
-        action: Literal["reload", "load", "unload"],
+        action: Literal["reload", "load", "unload", "rescan"],
+        extension: str | None = None,
     ) -> None:
         """Handle the /hotswap command."""
-        if action == "reload":
-            # Prevent self-reload to avoid potentially breaking the hotswap command during use
-            extensions = [ext for ext in self.bot.extensions if ext != "capy_discord.exts.tools.hotswap"]
-            if not extensions:
-                await interaction.response.send_message("No extensions are currently loaded.", ephemeral=True)
-                return
-        elif action == "load":
-            extensions = self.get_unloaded_cogs()
-            if not extensions:
-                await interaction.response.send_message("All available extensions are already loaded.", ephemeral=True)
-                return
-        else:  # unload
-            extensions = [ext for ext in self.bot.extensions if ext != "capy_discord.exts.tools.hotswap"]
-            if not extensions:
-                await interaction.response.send_message("No extensions are currently loaded.", ephemeral=True)
-                return
-
-        # Sort extensions for better UX
-        extensions.sort()
-
-        # Discord select menu limit is 25 options
-        view = HotswapView(extensions[:25], action)
-        await view.reply(interaction, f"Select an extension to {action}:", ephemeral=True)
+        if extension is not None:
+            await self._hotswap_extension(interaction, action, extension)
+            return
+
+        # Walking the extensions package imports it, so acknowledge the interaction first
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        if action == "rescan":
+            # Pick up extension files added since the last scan. The import system's directory
+            # caches must be invalidated too, or loading a newly created module can still fail
+            importlib.invalidate_caches()
+            get_extensions.cache_clear()
+            await interaction.followup.send(
+                embed=success_embed("Extensions Rescanned", f"Found {len(get_extensions())} extensions."),
+                ephemeral=True,
+            )
+            return
+
+        targets = self._targets(action)
+        if not targets:
+            message = (
+                "All available extensions are already loaded."
+                if action == "load"
+                else "No extensions are currently loaded."
+            )
+            await interaction.followup.send(message, ephemeral=True)
+            return
+
+        prompt = f"Select an extension to {action}:"
+        if len(targets) > MAX_SELECT_OPTIONS:
+            prompt = (
+                f"Select an extension to {action} (showing the first {MAX_SELECT_OPTIONS} of {len(targets)}, "
+                "type a name in `extension` to reach the rest):"
+            )
+
+        view = HotswapView(heapq.nsmallest(MAX_SELECT_OPTIONS, targets), action, self.bot)
+        view.message = await interaction.followup.send(prompt, view=view, ephemeral=True, wait=True)
+
+    async def _hotswap_extension(self, interaction: discord.Interaction, action: str, extension: str) -> None:
+        """Apply the action to an extension typed into the command, after checking it is a valid target."""
+        if action == "rescan":
+            await interaction.response.send_message("The rescan action does not take an extension.", ephemeral=True)
+            return
+        if extension == HOTSWAP_EXTENSION and action != "load":
+            await interaction.response.send_message(f"The hotswap extension cannot {action} itself.", ephemeral=True)
+            return
+        # Autocomplete only suggests values, so anything could have been typed in
+        if extension not in self._targets(action):
+            await interaction.response.send_message(f"Unknown extension `{extension}` for {action}.", ephemeral=True)
+            return
+        await _apply_action(self.bot, interaction, action, extension)
+
+    @hotswap.autocomplete("extension")
+    async def extension_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        """Suggest extensions matching the typed text, searching the full set rather than the first 25."""
+        return [
+            app_commands.Choice(name=ext, value=ext) for ext in self._candidates(interaction.namespace.action, current)
+        ]
 
     # If debug_guild_id is set, restrict to that guild
     if settings.debug_guild_id:
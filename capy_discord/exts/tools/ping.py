@@ -26,12 +26,13 @@ class Ping(commands.Cog):
             latency = round(self.bot.latency * 1000)  # in ms
             message = f"Pong! {latency} ms Latency!"
             embed = discord.Embed(title="Ping", description=message)
-            self.log.info("/ping invoked user: %s guild: %s", interaction.user.id, interaction.guild_id)
+            if self.log.isEnabledFor(logging.INFO):
+                self.log.info("/ping invoked user: %s guild: %s", interaction.user.id, interaction.guild_id)
 
             await interaction.response.send_message(embed=embed)
 
         except Exception:
-            self.log.exception("/ping attempted user")
+            self.log.exception("/ping failed for user: %s guild: %s", interaction.user.id, interaction.guild_id)
             await interaction.response.send_message("We're sorry, this interaction failed. Please contact an admin.")
 
 
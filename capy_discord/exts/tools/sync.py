@@ -7,6 +7,7 @@ This module handles synchronizing application commands with Discord:
 - Debug guild sync (when DEBUG_GUILD_ID is configured)
 """
 
+import asyncio
 import logging
 
 import discord
@@ -15,6 +16,21 @@ from discord.ext import commands
 
 from capy_discord.config import settings
 
+MAX_LISTED_COMMANDS = 20
+
+
+def _summarize_synced(synced: list[app_commands.AppCommand]) -> str:
+    """Build a short name listing for synced commands.
+
+    Only the first ``MAX_LISTED_COMMANDS`` names are listed so the reply stays
+    under Discord's message length limit.
+    """
+    names = [cmd.name for cmd in synced]
+    summary = ", ".join(names[:MAX_LISTED_COMMANDS])
+    if len(names) > MAX_LISTED_COMMANDS:
+        summary += f" (+{len(names) - MAX_LISTED_COMMANDS} more)"
+    return summary
+
 
 class Sync(commands.Cog):
     """Cog for synchronizing application commands."""
@@ -32,15 +48,18 @@ class Sync(commands.Cog):
             A tuple of (global_commands, guild_commands).
             guild_commands is None if no debug_guild_id is configured.
         """
-        # Sync global commands
-        global_synced: list[app_commands.AppCommand] = await self.bot.tree.sync()
-        self.log.info("Synced %d global commands: %s", len(global_synced), [c.name for c in global_synced])
-
-        # Sync debug guild if configured (for guild-specific commands like /hotswap)
         guild_synced: list[app_commands.AppCommand] | None = None
         if settings.debug_guild_id:
+            # Sync global commands and the debug guild (for guild-specific commands like /hotswap).
+            # These are independent requests, so run them concurrently.
             guild = discord.Object(id=settings.debug_guild_id)
-            guild_synced = await self.bot.tree.sync(guild=guild)
+            global_synced, guild_synced = await asyncio.gather(self.bot.tree.sync(), self.bot.tree.sync(guild=guild))
+        else:
+            # Sync global commands
+            global_synced = await self.bot.tree.sync()
+
+        self.log.info("Synced %d global commands: %s", len(global_synced), [c.name for c in global_synced])
+        if guild_synced is not None:
             self.log.info(
                 "Synced %d commands to debug guild %s: %s",
                 len(guild_synced),
@@ -81,7 +100,7 @@ class Sync(commands.Cog):
             await ctx.send(description)
 
         except Exception:
-            self.log.exception("!sync attempted with error")
+            self.log.exception("!sync failed for user: %s", ctx.author.id)
             await ctx.send("Sync failed. Check logs.")
 
     @app_commands.command(name="sync", description="Sync application commands")
@@ -93,17 +112,15 @@ class Sync(commands.Cog):
 
             global_synced, guild_synced = await self._sync_commands()
 
-            description = f"Synced {len(global_synced)} global commands: {[cmd.name for cmd in global_synced]}"
+            description = f"Synced {len(global_synced)} global commands: {_summarize_synced(global_synced)}"
             if guild_synced is not None:
-                description += (
-                    f"\nSynced {len(guild_synced)} debug guild commands: {[cmd.name for cmd in guild_synced]}"
-                )
+                description += f"\nSynced {len(guild_synced)} debug guild commands: {_summarize_synced(guild_synced)}"
 
             self.log.info("/sync invoked user: %s guild: %s", interaction.user.id, interaction.guild_id)
             await interaction.followup.send(description)
 
         except Exception:
-            self.log.exception("/sync attempted user with error")
+            self.log.exception("/sync failed for user: %s guild: %s", interaction.user.id, interaction.guild_id)
             if not interaction.response.is_done():
                 await interaction.response.send_message(
                     "We're sorry, this interaction failed. Please contact an admin.",
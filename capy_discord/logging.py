@@ -5,6 +5,11 @@ from zoneinfo import ZoneInfo
 
 import discord
 
+LOG_DIR = Path("logs")
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Formatters are stateless, so a single instance is built at import and shared by file handlers
+FILE_FORMATTER = logging.Formatter("[{asctime}] [{levelname:<8}] {name}: {message}", LOG_DATE_FORMAT, style="{")
+
 
 def setup_logging(level: int = logging.INFO) -> None:
     """Set up the logging configuration.
@@ -13,12 +18,11 @@ def setup_logging(level: int = logging.INFO) -> None:
     and a unique timestamped log file in the 'logs/' directory.
     """
     # 1. Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+    LOG_DIR.mkdir(exist_ok=True)
 
     # 2. Generate timestamped filename for this session
     timestamp = datetime.now(ZoneInfo("UTC")).strftime("%Y-%m-%d_%H-%M-%S")
-    log_file = log_dir / f"capy_{timestamp}.log"
+    log_file = LOG_DIR / f"capy_{timestamp}.log"
 
     # 3. Setup Console Logging (Standard Discord format)
     # root=True ensures we capture logs from all libraries (discord, asyncio, etc.)
@@ -27,7 +31,5 @@ def setup_logging(level: int = logging.INFO) -> None:
     # 4. Setup Consolidated File Logging
     # We use mode="w" (or "a", but timestamp ensures uniqueness)
     file_handler = logging.FileHandler(filename=log_file, encoding="utf-8", mode="w")
-    dt_fmt = "%Y-%m-%d %H:%M:%S"
-    formatter = logging.Formatter("[{asctime}] [{levelname:<8}] {name}: {message}", dt_fmt, style="{")
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(FILE_FORMATTER)
     logging.getLogger().addHandler(file_handler)
@@ -1,19 +1,96 @@
 import logging
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+import weakref
+from collections.abc import Awaitable, Callable, Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple, TypeVar
 
 import discord
 from discord import ui
 from pydantic import BaseModel, ValidationError
-from pydantic_core import PydanticUndefined
 
 from capy_discord.ui.modal import BaseModal
 
+log = logging.getLogger(__name__)
+
 T = TypeVar("T", bound=BaseModel)
 
 MAX_DISCORD_ROWS = 5
 MAX_TEXT_INPUT_LEN = 4000
 MAX_PLACEHOLDER_LEN = 100
+MAX_LABEL_LEN = 45
+PARAGRAPH_THRESHOLD = 100
+# Field default types that can be pre-filled into a TextInput
+SCALAR_DEFAULT_TYPES = (str, int, float)
+
+
+class _FieldSpec(NamedTuple):
+    """Precomputed TextInput settings for a single model field."""
+
+    name: str
+    default: str | None
+    kwargs: Mapping[str, Any]
+
+
+# Keyed weakly so model classes replaced by an extension reload can be garbage collected
+_MODEL_SPECS: weakref.WeakKeyDictionary[type[BaseModel], tuple[_FieldSpec, ...]] = weakref.WeakKeyDictionary()
+
+
+def _compile_model_spec(model_cls: type[BaseModel]) -> tuple[_FieldSpec, ...]:
+    """Introspect a Pydantic model once and cache the TextInput settings for its fields.
+
+    Args:
+        model_cls: The Pydantic model class defining the form schema.
+
+    Returns:
+        One spec per field, in model field order.
+    """
+    cached = _MODEL_SPECS.get(model_cls)
+    if cached is not None:
+        return cached
+
+    specs = []
+    for row, (name, field_info) in enumerate(model_cls.model_fields.items()):
+        # None and PydanticUndefined both fail the isinstance check
+        default = str(field_info.default) if isinstance(field_info.default, SCALAR_DEFAULT_TYPES) else None
+
+        # Determine constraints from Pydantic metadata
+        max_len = None
+        min_len = None
+        for metadata in field_info.metadata:
+            value = getattr(metadata, "max_length", None)
+            if value is not None:
+                max_len = value
+            value = getattr(metadata, "min_length", None)
+            if value is not None:
+                min_len = value
+            if max_len is not None and min_len is not None:
+                break
+
+        # Determine Label (Title) and Placeholder (Description)
+        label = field_info.title or name.replace("_", " ").title()
+        placeholder = field_info.description or f"Enter {label}..."
+
+        # Note: Discord TextInput max_length is 4000
+        # The spec is cached and shared by every modal built from this model, so keep it read-only
+        kwargs = MappingProxyType(
+            {
+                "label": label[:MAX_LABEL_LEN],
+                "placeholder": placeholder[:MAX_PLACEHOLDER_LEN],
+                "required": field_info.is_required(),
+                "max_length": min(max_len, MAX_TEXT_INPUT_LEN) if max_len else MAX_TEXT_INPUT_LEN,
+                "min_length": min_len,
+                "style": (
+                    discord.TextStyle.paragraph
+                    if (max_len and max_len > PARAGRAPH_THRESHOLD)
+                    else discord.TextStyle.short
+                ),
+                "row": row,
+            }
+        )
+        specs.append(_FieldSpec(name, default, kwargs))
+
+    _MODEL_SPECS[model_cls] = result = tuple(specs)
+    return result
 
 
 class RetryView[T: BaseModel](ui.View):
@@ -65,7 +142,7 @@ class ModelModal[T: BaseModel](BaseModal):
         super().__init__(title=title, timeout=timeout)
         self.model_cls = model_cls
         self.callback = callback
-        self.log = logging.getLogger(__name__)
+        self.log = log
 
         # Discord Modals are limited to 5 ActionRows (items)
         if len(self.model_cls.model_fields) > MAX_DISCORD_ROWS:
@@ -79,52 +156,17 @@ class ModelModal[T: BaseModel](BaseModal):
         self._generate_fields(initial_data or {})
 
     def _generate_fields(self, initial_data: dict[str, Any]) -> None:
-        """Generate UI components from the Pydantic model fields."""
-        for name, field_info in self.model_cls.model_fields.items():
-            # Determine default/initial value
+        """Generate UI components from the cached Pydantic model field specs."""
+        for spec in _compile_model_spec(self.model_cls):
             # Priority: initial_data > field default
-            default_value = initial_data.get(name)
-
-            if (
-                default_value is None
-                and field_info.default is not None
-                and field_info.default is not PydanticUndefined
-                and isinstance(field_info.default, (str, int, float))
-            ):
-                default_value = str(field_info.default)
-
-            # Determine constraints from Pydantic metadata
-            max_len = None
-            min_len = None
-            max_len_thresh = 100
-
-            for metadata in field_info.metadata:
-                if hasattr(metadata, "max_length"):
-                    max_len = metadata.max_length
-                if hasattr(metadata, "min_length"):
-                    min_len = metadata.min_length
-
-            # Determine Label (Title) and Placeholder (Description)
-            label = field_info.title or name.replace("_", " ").title()
-            placeholder = field_info.description or f"Enter {label}..."
-
-            # Create the input
-            # Note: Discord TextInput max_length is 4000
-            text_input = ui.TextInput(
-                label=label[:45],
-                placeholder=placeholder[:MAX_PLACEHOLDER_LEN],
-                default=str(default_value) if default_value else None,
-                required=field_info.is_required(),
-                max_length=min(max_len, MAX_TEXT_INPUT_LEN) if max_len else MAX_TEXT_INPUT_LEN,
-                min_length=min_len,
-                style=(
-                    discord.TextStyle.paragraph if (max_len and max_len > max_len_thresh) else discord.TextStyle.short
-                ),
-                row=len(self._inputs) if len(self._inputs) < MAX_DISCORD_ROWS else 4,
-            )
+            default_value = initial_data.get(spec.name)
+            if default_value is None:
+                default_value = spec.default
+
+            text_input = ui.TextInput(default=str(default_value) if default_value else None, **spec.kwargs)
 
             self.add_item(text_input)
-            self._inputs[name] = text_input
+            self._inputs[spec.name] = text_input
 
     async def on_submit(self, interaction: discord.Interaction) -> None:
         """Validate inputs and trigger callback or retry flow."""
@@ -139,13 +181,11 @@ class ModelModal[T: BaseModel](BaseModal):
 
         except ValidationError as e:
             # Validation Failed
-            error_messages = []
-            for err in e.errors():
-                loc = str(err["loc"][0])
-                msg = err["msg"].replace("Value error, ", "")  # Cleanup common pydantic prefix
-                error_messages.append(f"• **{loc}**: {msg}")
-
-            error_text = "\n".join(error_messages)
+            # Cleanup common pydantic prefix
+            error_text = "\n".join(
+                f"• **{err['loc'][0]}**: {err['msg'].removeprefix('Value error, ')}"
+                for err in e.errors(include_url=False, include_input=False)
+            )
 
             # create retry view with preserved input
             view = RetryView(model_cls=self.model_cls, callback=self.callback, title=self.title, initial_data=raw_data)
@@ -5,6 +5,8 @@ from typing import Any, Self
 import discord
 from discord import ui
 
+log = logging.getLogger(__name__)
+
 
 class BaseModal(ui.Modal):
     """A base modal class that implements common functionality.
@@ -16,7 +18,7 @@ class BaseModal(ui.Modal):
     def __init__(self, *, title: str, timeout: float | None = None) -> None:
         """Initialize the BaseModal."""
         super().__init__(title=title, timeout=timeout)
-        self.log = logging.getLogger(__name__)
+        self.log = log
 
 
 class CallbackModal(BaseModal):
@@ -1,9 +1,15 @@
 import logging
-from typing import Any, cast
 
 import discord
 from discord import ui
 
+log = logging.getLogger(__name__)
+
+ERROR_MESSAGE = "❌ **Something went wrong!**\nThe error has been logged for the developers."
+
+# Item types that expose a ``disabled`` attribute
+DISABLEABLE_ITEMS = (ui.Button, ui.Select, ui.UserSelect, ui.RoleSelect, ui.MentionableSelect, ui.ChannelSelect)
+
 
 class BaseView(ui.View):
     """A base view class that handles common lifecycle events like timeouts.
@@ -17,19 +23,17 @@ class BaseView(ui.View):
     def __init__(self, *, timeout: float | None = 180) -> None:
         """Initialize the BaseView."""
         super().__init__(timeout=timeout)
-        self.message: discord.InteractionMessage | None = None
-        self.log = logging.getLogger(__name__)
+        self.message: discord.InteractionMessage | discord.WebhookMessage | None = None
+        self.log = log
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: ui.Item) -> None:
         """Handle errors raised in view items."""
         self.log.error("Error in view %s item %s: %s", self, item, error, exc_info=error)
 
-        err_msg = "❌ **Something went wrong!**\nThe error has been logged for the developers."
-
         if interaction.response.is_done():
-            await interaction.followup.send(err_msg, ephemeral=True)
+            await interaction.followup.send(ERROR_MESSAGE, ephemeral=True)
         else:
-            await interaction.response.send_message(err_msg, ephemeral=True)
+            await interaction.response.send_message(ERROR_MESSAGE, ephemeral=True)
 
     async def on_timeout(self) -> None:
         """Disable all items and update the message on timeout."""
@@ -48,8 +52,8 @@ class BaseView(ui.View):
     def disable_all_items(self) -> None:
         """Disable all interactive items in the view."""
         for item in self.children:
-            if hasattr(item, "disabled"):
-                cast("Any", item).disabled = True
+            if isinstance(item, DISABLEABLE_ITEMS):
+                item.disabled = True
 
     async def reply(  # noqa: PLR0913
         self,
@@ -1 +1 @@
-from capy_discord.utils.extensions import EXTENSIONS
+from capy_discord.utils.extensions import get_extensions
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
 import importlib
 import inspect
 import pkgutil
@@ -54,4 +55,10 @@ def walk_extensions() -> Iterator[str]:
         yield module.name
 
 
-EXTENSIONS = frozenset(walk_extensions())
+@functools.cache
+def get_extensions() -> frozenset[str]:
+    """Return all extension names, walking the package only on first use.
+
+    Call ``get_extensions.cache_clear()`` to pick up extensions added since the last walk.
+    """
+    return frozenset(walk_extensions())
@@ -0,0 +1,213 @@
+"""Tests for the hotswap cog."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from capy_discord.exts.tools import hotswap
+from capy_discord.exts.tools.hotswap import HOTSWAP_EXTENSION, HotswapCog, HotswapSelect, MAX_SELECT_OPTIONS
+
+
+def _make_cog(loaded: list[str]) -> HotswapCog:
+    bot = MagicMock()
+    bot.extensions = dict.fromkeys(loaded)
+    bot.reload_extension = AsyncMock()
+    bot.load_extension = AsyncMock()
+    bot.unload_extension = AsyncMock()
+    return HotswapCog(bot)
+
+
+def _make_interaction() -> MagicMock:
+    interaction = MagicMock()
+    interaction.response.send_message = AsyncMock()
+    interaction.response.defer = AsyncMock()
+    interaction.followup.send = AsyncMock()
+    return interaction
+
+
+def test_candidates_filter_by_query_ignoring_case():
+    """Test that candidates match the query regardless of case."""
+    cog = _make_cog(["capy_discord.exts.tools.Ping", "capy_discord.exts.tools.sync", "capy_discord.exts.guild"])
+
+    assert cog._candidates("reload", "PING") == ["capy_discord.exts.tools.Ping"]
+    assert cog._candidates("unload", "tools") == ["capy_discord.exts.tools.Ping", "capy_discord.exts.tools.sync"]
+
+
+def test_candidates_exclude_hotswap_for_reload_and_unload():
+    """Test that the hotswap extension is never offered for reload or unload."""
+    cog = _make_cog([HOTSWAP_EXTENSION, "capy_discord.exts.guild"])
+
+    assert cog._candidates("reload") == ["capy_discord.exts.guild"]
+    assert cog._candidates("unload") == ["capy_discord.exts.guild"]
+
+
+def test_candidates_for_load_are_unloaded_extensions(monkeypatch: pytest.MonkeyPatch):
+    """Test that load candidates are the available extensions that are not loaded."""
+    available = frozenset({"capy_discord.exts.guild", "capy_discord.exts.tools.ping"})
+    monkeypatch.setattr(hotswap, "get_extensions", lambda: available)
+    cog = _make_cog(["capy_discord.exts.guild"])
+
+    assert cog._candidates("load") == ["capy_discord.exts.tools.ping"]
+
+
+def test_candidates_capped_at_max_select_options():
+    """Test that only the first 25 candidates in alphabetical order are returned."""
+    names = [f"capy_discord.exts.ext{i:02}" for i in range(MAX_SELECT_OPTIONS + 10)]
+    cog = _make_cog(list(reversed(names)))
+
+    assert cog._candidates("reload") == names[:MAX_SELECT_OPTIONS]
+
+
+@pytest.mark.parametrize("action", [None, "rescan"])
+def test_candidates_empty_without_extension_action(action: str | None):
+    """Test that there are no candidates before an action is picked or for rescan."""
+    cog = _make_cog(["capy_discord.exts.guild"])
+
+    assert cog._candidates(action) == []
+
+
+@pytest.mark.parametrize("action", ["reload", "unload"])
+def test_hotswap_refuses_to_act_on_itself(action: str):
+    """Test that the hotswap extension cannot reload or unload itself."""
+    cog = _make_cog([HOTSWAP_EXTENSION])
+    interaction = _make_interaction()
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, action, HOTSWAP_EXTENSION))
+
+    interaction.response.send_message.assert_awaited_once_with(
+        f"The hotswap extension cannot {action} itself.", ephemeral=True
+    )
+    interaction.response.defer.assert_not_awaited()
+    cog.bot.reload_extension.assert_not_awaited()
+    cog.bot.unload_extension.assert_not_awaited()
+
+
+def test_hotswap_rescan_rejects_extension():
+    """Test that rescan refuses an extension argument."""
+    cog = _make_cog([])
+    interaction = _make_interaction()
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, "rescan", "capy_discord.exts.guild"))
+
+    interaction.response.send_message.assert_awaited_once_with(
+        "The rescan action does not take an extension.", ephemeral=True
+    )
+    interaction.response.defer.assert_not_awaited()
+
+
+@pytest.mark.parametrize(("action", "extension"), [("load", "os"), ("reload", "capy_discord.exts.guild")])
+def test_hotswap_rejects_unknown_extension(monkeypatch: pytest.MonkeyPatch, action: str, extension: str):
+    """Test that typed extensions outside the action's targets are refused."""
+    monkeypatch.setattr(hotswap, "get_extensions", lambda: frozenset({"capy_discord.exts.tools.ping"}))
+    cog = _make_cog(["capy_discord.exts.tools.ping"])
+    interaction = _make_interaction()
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, action, extension))
+
+    interaction.response.send_message.assert_awaited_once_with(
+        f"Unknown extension `{extension}` for {action}.", ephemeral=True
+    )
+    interaction.response.defer.assert_not_awaited()
+    cog.bot.load_extension.assert_not_awaited()
+    cog.bot.reload_extension.assert_not_awaited()
+
+
+def test_hotswap_applies_action_to_typed_extension():
+    """Test that a valid typed extension is acted on directly."""
+    cog = _make_cog(["capy_discord.exts.guild"])
+    interaction = _make_interaction()
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, "reload", "capy_discord.exts.guild"))
+
+    cog.bot.reload_extension.assert_awaited_once_with("capy_discord.exts.guild")
+    interaction.followup.send.assert_awaited_once()
+
+
+def test_apply_action_defers_then_reports_success():
+    """Test that the action is acknowledged first and the result sent as a followup."""
+    bot = _make_cog([]).bot
+    interaction = _make_interaction()
+
+    asyncio.run(hotswap._apply_action(bot, interaction, "load", "capy_discord.exts.guild"))
+
+    interaction.response.defer.assert_awaited_once_with(ephemeral=True, thinking=True)
+    bot.load_extension.assert_awaited_once_with("capy_discord.exts.guild")
+    embed = interaction.followup.send.await_args.kwargs["embed"]
+    assert embed.title == "Extension Loaded"
+    interaction.response.send_message.assert_not_awaited()
+
+
+def test_apply_action_reports_failure():
+    """Test that a failing action is reported as an error followup."""
+    bot = _make_cog([]).bot
+    bot.unload_extension.side_effect = RuntimeError("boom")
+    interaction = _make_interaction()
+
+    asyncio.run(hotswap._apply_action(bot, interaction, "unload", "capy_discord.exts.guild"))
+
+    interaction.response.defer.assert_awaited_once_with(ephemeral=True, thinking=True)
+    embed = interaction.followup.send.await_args.kwargs["embed"]
+    assert embed.title == "Failed to Unload Extension"
+    assert "boom" in embed.description
+
+
+def test_select_callback_uses_injected_bot(monkeypatch: pytest.MonkeyPatch):
+    """Test that the select menu applies the action with the bot it was given."""
+    apply_action = AsyncMock()
+    monkeypatch.setattr(hotswap, "_apply_action", apply_action)
+    bot = MagicMock()
+    interaction = _make_interaction()
+
+    async def run() -> None:
+        select = HotswapSelect(["capy_discord.exts.guild"], "reload", bot)
+        select._values = ["capy_discord.exts.guild"]
+        await select.callback(interaction)
+
+    asyncio.run(run())
+
+    apply_action.assert_awaited_once_with(bot, interaction, "reload", "capy_discord.exts.guild")
+
+
+def test_hotswap_rescan_clears_cache_and_reports(monkeypatch: pytest.MonkeyPatch):
+    """Test that rescan clears the extension cache and reports the new count."""
+    get_extensions = MagicMock(return_value=frozenset({"capy_discord.exts.guild", "capy_discord.exts.tools.ping"}))
+    monkeypatch.setattr(hotswap, "get_extensions", get_extensions)
+    cog = _make_cog([])
+    interaction = _make_interaction()
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, "rescan", None))
+
+    interaction.response.defer.assert_awaited_once_with(ephemeral=True, thinking=True)
+    get_extensions.cache_clear.assert_called_once()
+    embed = interaction.followup.send.await_args.kwargs["embed"]
+    assert embed.description == "Found 2 extensions."
+
+
+def test_hotswap_menu_tracks_followup_message():
+    """Test that the menu is sent as a followup and its message is tracked by the view."""
+    cog = _make_cog(["capy_discord.exts.guild"])
+    interaction = _make_interaction()
+    message = MagicMock()
+    interaction.followup.send.return_value = message
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, "reload", None))
+
+    interaction.response.defer.assert_awaited_once_with(ephemeral=True, thinking=True)
+    args, kwargs = interaction.followup.send.await_args
+    assert args == ("Select an extension to reload:",)
+    assert kwargs["wait"] is True
+    assert kwargs["view"].message is message
+
+
+def test_hotswap_menu_notes_truncation():
+    """Test that the menu says when there are more extensions than it can show."""
+    names = [f"capy_discord.exts.ext{i:02}" for i in range(MAX_SELECT_OPTIONS + 5)]
+    cog = _make_cog(names)
+    interaction = _make_interaction()
+
+    asyncio.run(cog.hotswap.callback(cog, interaction, "unload", None))
+
+    args, kwargs = interaction.followup.send.await_args
+    assert f"showing the first {MAX_SELECT_OPTIONS} of {len(names)}" in args[0]
+    assert len(kwargs["view"].children[0].options) == MAX_SELECT_OPTIONS
@@ -0,0 +1,34 @@
+"""Tests for the sync cog."""
+
+from unittest.mock import MagicMock
+
+from capy_discord.exts.tools.sync import MAX_LISTED_COMMANDS, _summarize_synced
+
+
+def _make_commands(count: int) -> list[MagicMock]:
+    commands = []
+    for i in range(count):
+        command = MagicMock(name=f"cmd{i}")
+        command.name = f"cmd{i}"
+        commands.append(command)
+    return commands
+
+
+def test_summarize_synced_lists_all_names_under_limit():
+    """Test that every name is listed when there are fewer than the limit."""
+    assert _summarize_synced(_make_commands(3)) == "cmd0, cmd1, cmd2"
+
+
+def test_summarize_synced_lists_all_names_at_limit():
+    """Test that exactly the limit lists every name without a suffix."""
+    summary = _summarize_synced(_make_commands(MAX_LISTED_COMMANDS))
+
+    assert summary == ", ".join(f"cmd{i}" for i in range(MAX_LISTED_COMMANDS))
+    assert "more" not in summary
+
+
+def test_summarize_synced_truncates_over_limit():
+    """Test that names past the limit are replaced by a count of the rest."""
+    summary = _summarize_synced(_make_commands(MAX_LISTED_COMMANDS + 7))
+
+    assert summary == ", ".join(f"cmd{i}" for i in range(MAX_LISTED_COMMANDS)) + " (+7 more)"